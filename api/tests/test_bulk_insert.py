@@ -0,0 +1,60 @@
+"""
+Bulk creates insert their rows with one multi-row statement per table and
+still report the id of every row.
+"""
+
+import types
+
+import pytest
+from sqlalchemy import event
+
+import app as tix
+
+
+@pytest.fixture
+def client(tmp_path):
+    app = tix.create_app(types.SimpleNamespace(configuration="testing"))
+    app.config.update(
+        SQLALCHEMY_DATABASE_URI=f"sqlite:///{tmp_path / 'test.db'}",
+        AUTHENTICATION=False,
+    )
+    with app.app_context():
+        tix.db.create_all()
+        yield app.test_client()
+        tix.db.session.remove()
+
+
+def issue(i, **extra):
+    return dict(
+        created_by="adam@example.com",
+        issue_project="ABC",
+        issue_type="BUG",
+        issue_priority=3,
+        issue_story_points=5,
+        issue_summary=f"Issue {i}",
+        **extra,
+    )
+
+
+def test_bulk_create_is_one_insert(client):
+    inserts = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        if statement.startswith("INSERT INTO issues "):
+            inserts.append(statement)
+
+    # the optional keys differ between items
+    items = [issue(0), issue(1, issue_description="x"), issue(2), issue(3), issue(4)]
+    event.listen(tix.db.engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        response = client.post("/api/issues/bulk", json=items)
+    finally:
+        event.remove(tix.db.engine, "before_cursor_execute", before_cursor_execute)
+    assert response.status_code == 200, response.get_json()
+    # one statement per distinct set of keys
+    assert len(inserts) == 2
+
+    results = response.get_json()["data"]
+    stored = dict(tix.db.session.query(tix.IssueModel.issue_name, tix.IssueModel.id))
+    assert [result["status"] for result in results] == ["created"] * 5
+    assert {r["issue_name"]: r["id"] for r in results} == stored
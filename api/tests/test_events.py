@@ -0,0 +1,79 @@
+"""
+Events of bulk inserted activity carry the id of the row, such that
+subscribers can tell them apart and fetch the row itself.
+"""
+
+import types
+
+import pytest
+
+import app as tix
+
+
+@pytest.fixture
+def client(tmp_path):
+    app = tix.create_app(types.SimpleNamespace(configuration="testing"))
+    app.config.update(
+        SQLALCHEMY_DATABASE_URI=f"sqlite:///{tmp_path / 'test.db'}",
+        AUTHENTICATION=False,
+    )
+    with app.app_context():
+        tix.db.create_all()
+        tix.bulk_load(
+            "issues",
+            [
+                dict(
+                    created_by="adam@example.com",
+                    issue_project="ABC",
+                    issue_type="BUG",
+                    issue_priority=3,
+                    issue_story_points=5,
+                    issue_summary="Issue",
+                )
+            ],
+        )
+        yield app.test_client()
+        tix.db.session.remove()
+
+
+@pytest.fixture
+def published(monkeypatch):
+    events = []
+    monkeypatch.setattr(tix.event_broker, "publish", events.extend)
+    return events
+
+
+def activity_ids(events):
+    return sorted(e["id"] for e in events if e["type"] == "activity")
+
+
+def stored_activity_ids():
+    return sorted(id_ for id_, in tix.db.session.query(tix.ActivityModel.id))
+
+
+def test_update_publishes_activity_ids(client, published):
+    response = client.put(
+        "/api/issues/ABC-0001",
+        json=dict(
+            issue_type="EPIC",
+            issue_priority=1,
+            issue_story_points=5,
+            issue_summary="Changed",
+        ),
+    )
+    assert response.status_code == 200, response.get_json()
+    assert activity_ids(published) == stored_activity_ids()
+    assert len(activity_ids(published)) == 3
+
+
+def test_bulk_activity_publishes_ids(client, published):
+    comment = dict(
+        issue_id=1,
+        created_by="bill@example.com",
+        activity_type="COMMENT",
+        activity_text="Comment",
+    )
+    response = client.post("/api/activity/bulk", json=[comment] * 3)
+    assert response.status_code == 200, response.get_json()
+    created = sorted(result["id"] for result in response.get_json()["data"])
+    assert activity_ids(published) == created == stored_activity_ids()
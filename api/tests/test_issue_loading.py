@@ -0,0 +1,92 @@
+"""
+Issue reads must load activity in a fixed number of queries, however many
+issues a page holds.
+"""
+
+import types
+
+import pytest
+from sqlalchemy import event
+
+import app as tix
+
+
+@pytest.fixture
+def client(tmp_path):
+    app = tix.create_app(types.SimpleNamespace(configuration="testing"))
+    app.config.update(SQLALCHEMY_DATABASE_URI=f"sqlite:///{tmp_path / 'test.db'}")
+    with app.app_context():
+        tix.db.create_all()
+        issues = [
+            dict(
+                created_by="adam@example.com",
+                issue_project="ABC",
+                issue_type="BUG",
+                issue_priority=3,
+                issue_story_points=5,
+                issue_summary=f"Issue {i}",
+            )
+            for i in range(20)
+        ]
+        tix.bulk_load("issues", issues)
+        activity = [
+            dict(
+                issue_id=issue_id,
+                created_by="bill@example.com",
+                activity_type="COMMENT",
+                activity_text=f"Comment {n}",
+            )
+            for issue_id in range(1, 21)
+            for n in range(3)
+        ]
+        tix.bulk_load("activity", activity)
+        yield app.test_client()
+        tix.db.session.remove()
+
+
+def count_queries(client, url):
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(tix.db.engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        response = client.get(url)
+    finally:
+        event.remove(tix.db.engine, "before_cursor_execute", before_cursor_execute)
+    assert response.status_code == 200, response.get_json()
+    return len(statements), response.get_json()["data"]
+
+
+def test_list_omits_activity(client):
+    queries, data = count_queries(client, "/api/issues?size=20")
+    assert queries == 1
+    assert len(data) == 20
+    assert all("activity" not in issue for issue in data)
+
+
+def test_list_includes_activity_in_one_batched_query(client):
+    queries, data = count_queries(client, "/api/issues?size=20&include=activity")
+    assert queries == 2
+    assert [len(issue["activity"]) for issue in data] == [3] * 20
+
+
+def test_single_issue_joins_activity(client):
+    queries, data = count_queries(client, "/api/issues/ABC-0001")
+    assert queries == 1
+    assert len(data["activity"]) == 3
+
+
+def test_fields_naming_activity_includes_it(client):
+    queries, data = count_queries(client, "/api/issues?size=20&fields=activity")
+    assert queries == 2
+    assert [list(issue) for issue in data] == [["activity"]] * 20
+    assert [len(issue["activity"]) for issue in data] == [3] * 20
+
+
+def test_fields_without_activity_skips_include(client):
+    url = "/api/issues?size=20&include=activity&fields=issue_name"
+    queries, data = count_queries(client, url)
+    assert queries == 1
+    assert [list(issue) for issue in data] == [["issue_name"]] * 20
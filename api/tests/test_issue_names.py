@@ -0,0 +1,66 @@
+"""
+Issues created concurrently must each be given a distinct name, numbered
+without gaps within their project.
+"""
+
+import types
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import app as tix
+
+PROJECTS = ["ABC", "XYZ"]
+THREADS = 8
+ISSUES_PER_THREAD = 10
+
+
+@pytest.fixture
+def app(tmp_path):
+    app = tix.create_app(types.SimpleNamespace(configuration="testing"))
+    # threads need a database file, every connection to :memory: is a new one
+    app.config.update(
+        SQLALCHEMY_DATABASE_URI=f"sqlite:///{tmp_path / 'test.db'}",
+        AUTHENTICATION=False,
+    )
+    with app.app_context():
+        tix.db.create_all()
+    yield app
+    with app.app_context():
+        tix.db.session.remove()
+        tix.db.engine.dispose()
+
+
+def create_issues(app, thread):
+    client = app.test_client()
+    names = []
+    for i in range(ISSUES_PER_THREAD):
+        response = client.post(
+            "/api/issues",
+            json=dict(
+                created_by="adam@example.com",
+                issue_project=PROJECTS[(thread + i) % len(PROJECTS)],
+                issue_type="BUG",
+                issue_priority=3,
+                issue_story_points=5,
+                issue_summary=f"Thread {thread} issue {i}",
+            ),
+        )
+        assert response.status_code == 200, response.get_json()
+        names.append(response.get_json()["data"]["issue_name"])
+    return names
+
+
+def test_concurrent_issues_are_numbered_without_gaps(app):
+    with ThreadPoolExecutor(THREADS) as pool:
+        futures = [pool.submit(create_issues, app, t) for t in range(THREADS)]
+        names = [name for future in futures for name in future.result()]
+
+    assert len(names) == len(set(names)) == THREADS * ISSUES_PER_THREAD
+    for project in PROJECTS:
+        numbers = sorted(
+            tix.parse_issue_number(name)
+            for name in names
+            if name.startswith(f"{project}-")
+        )
+        assert numbers == list(range(1, len(numbers) + 1))
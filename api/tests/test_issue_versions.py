@@ -0,0 +1,56 @@
+"""
+The `version` sent with an update is validated as an integer, only a valid
+but outdated one is a conflict.
+"""
+
+import types
+
+import pytest
+
+import app as tix
+
+ISSUE = dict(
+    issue_type="BUG",
+    issue_priority=3,
+    issue_story_points=5,
+    issue_summary="Changed",
+)
+
+
+@pytest.fixture
+def client(tmp_path):
+    app = tix.create_app(types.SimpleNamespace(configuration="testing"))
+    app.config.update(
+        SQLALCHEMY_DATABASE_URI=f"sqlite:///{tmp_path / 'test.db'}",
+        AUTHENTICATION=False,
+    )
+    with app.app_context():
+        tix.db.create_all()
+        tix.bulk_load(
+            "issues",
+            [dict(created_by="adam@example.com", issue_project="ABC", **ISSUE)],
+        )
+        yield app.test_client()
+        tix.db.session.remove()
+
+
+@pytest.mark.parametrize(
+    "version, status",
+    [(1, 200), ("1", 200), (2, 409), ("one", 400), (0, 400), (True, 400)],
+)
+def test_put_version(client, version, status):
+    response = client.put(
+        "/api/issues/ABC-0001", json=dict(ISSUE, issue_priority=1, version=version)
+    )
+    assert response.status_code == status, response.get_json()
+
+
+def test_bulk_update_version(client):
+    items = [
+        dict(issue_name="ABC-0001", issue_priority=1, version="one"),
+        dict(issue_name="ABC-0001", issue_priority=2, version=2),
+    ]
+    response = client.post("/api/issues/bulk?mode=partial", json=items)
+    invalid, outdated = response.get_json()["data"]
+    assert invalid["errors"] == dict(version=["Not a valid integer."])
+    assert outdated["errors"] == dict(version=["Issue was updated since version 2"])
@@ -0,0 +1,54 @@
+"""
+With a shared `METRICS_DIR`, whichever worker answers the scrape reports the
+sum of every worker's series.
+"""
+
+import json
+import types
+
+import pytest
+
+import app as tix
+
+ROUTE = "/api/metrics/issues"
+
+
+@pytest.fixture
+def client(tmp_path):
+    app = tix.create_app(types.SimpleNamespace(configuration="testing"))
+    app.config.update(
+        SQLALCHEMY_DATABASE_URI=f"sqlite:///{tmp_path / 'test.db'}",
+        METRICS_DIR=str(tmp_path / "metrics"),
+    )
+    tix.metrics.init_app(app)
+    with app.app_context():
+        tix.db.create_all()
+        yield app.test_client()
+        tix.db.session.remove()
+    tix.metrics.path = None
+
+
+def sample(body, name, **labels):
+    pairs = ",".join(f'{k}="{v}"' for k, v in sorted(labels.items()))
+    for line in body.splitlines():
+        if line.startswith(f"{name}{{{pairs}}} "):
+            return float(line.rsplit(" ", 1)[1])
+    return None
+
+
+def test_scrape_sums_every_worker(client, tmp_path):
+    labels = [["method", "GET"], ["route", ROUTE], ["status", 200]]
+    other = tix.Metrics()
+    other.requests.inc(5, **dict(labels))
+    other.queries.observe(2, method="GET", route=ROUTE)
+    (tmp_path / "metrics" / "1.json").write_text(
+        json.dumps({m.name: m.snapshot() for m in other.all})
+    )
+    for _ in range(3):
+        assert client.get(ROUTE).status_code == 200
+
+    body = client.get("/api/metrics").get_data(as_text=True)
+    requests = sample(body, "tix_http_requests_total", **dict(labels))
+    assert requests == 5 + 3
+    count = sample(body, "tix_sql_queries_per_request_count", method="GET", route=ROUTE)
+    assert count == 1 + 3
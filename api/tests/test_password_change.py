@@ -0,0 +1,53 @@
+"""
+A password change reaches the logins cached by every worker, not only those
+of the worker which made it.
+"""
+
+import base64
+import types
+
+import pytest
+
+import app as tix
+
+
+@pytest.fixture
+def client(tmp_path):
+    app = tix.create_app(types.SimpleNamespace(configuration="testing"))
+    app.config.update(SQLALCHEMY_DATABASE_URI=f"sqlite:///{tmp_path / 'test.db'}")
+    with app.app_context():
+        tix.db.create_all()
+        user = tix.UserModel(username="adam")
+        user.hash_password("before")
+        tix.db.session.add(user)
+        tix.db.session.commit()
+        yield app.test_client()
+        tix.db.session.remove()
+
+
+def login(client, password):
+    credentials = base64.b64encode(f"adam:{password}".encode()).decode()
+    headers = dict(Authorization=f"Basic {credentials}")
+    return client.get("/api/auth/token", headers=headers).status_code
+
+
+def test_cached_login_is_dropped_after_password_change(client):
+    assert login(client, "before") == 200
+    # another worker changes the password, this one keeps its cached login
+    cached = dict(tix.auth_cache._data)
+    user = tix.UserModel.query.filter_by(username="adam").one()
+    user.hash_password("after")
+    tix.db.session.commit()
+    tix.auth_cache._data.update(cached)
+
+    assert login(client, "before") == 401
+    assert login(client, "after") == 200
+
+
+def test_rolled_back_change_keeps_cached_login(client):
+    assert login(client, "before") == 200
+    user = tix.UserModel.query.filter_by(username="adam").one()
+    user.hash_password("after")
+    tix.db.session.rollback()
+    assert tix.token_store.credentials("adam") == 0
+    assert login(client, "before") == 200
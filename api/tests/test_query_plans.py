@@ -0,0 +1,32 @@
+"""
+The hot queries must be planned with an index, a missing or unusable index
+shows up as a full table scan.
+"""
+
+import re
+import types
+
+import pytest
+
+import app as tix
+
+# SQLite reports `SCAN <table>` for a full scan, an ordered walk over an index
+# is `SCAN <table> USING INDEX ...`
+FULL_SCAN = re.compile(r"\bSCAN (issues|activity)\b(?! USING (COVERING )?INDEX)")
+
+
+@pytest.fixture
+def app(tmp_path):
+    app = tix.create_app(types.SimpleNamespace(configuration="testing"))
+    app.config.update(SQLALCHEMY_DATABASE_URI=f"sqlite:///{tmp_path / 'test.db'}")
+    with app.app_context():
+        tix.db.create_all()
+        yield app
+        tix.db.session.remove()
+
+
+def test_hot_queries_use_an_index(app):
+    plans = {name: tix.explain(query) for name, query in tix.hot_queries()}
+    scans = {name: plan for name, plan in plans.items() if FULL_SCAN.search(plan)}
+    assert not scans, scans
+    assert all("INDEX" in plan.upper() for plan in plans.values()), plans
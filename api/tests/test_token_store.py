@@ -0,0 +1,63 @@
+"""
+Tokens behave the same in the in-process store and against a Redis server,
+here a local fake of one.
+"""
+
+import time
+
+import pytest
+from flask import Flask
+
+import app as tix
+
+
+@pytest.fixture(params=["memory://", "redis://localhost:6379/0"])
+def store(request, monkeypatch):
+    if request.param.startswith("redis://"):
+        fakeredis = pytest.importorskip("fakeredis")
+        server = fakeredis.FakeServer()
+        monkeypatch.setattr(
+            tix.redis.Redis,
+            "from_url",
+            lambda url, **kwargs: fakeredis.FakeRedis(server=server, **kwargs),
+        )
+    app = Flask(__name__)
+    app.config.update(TOKEN_STORE_URL=request.param, TOKEN_STORE_PREFIX="test")
+    store = tix.TokenStore()
+    store.init_app(app)
+    return store
+
+
+def test_issue_and_lookup(store):
+    token = store.issue(7, expiration=60)
+    assert store.lookup(token) == 7
+    assert store.lookup("unknown") is None
+    assert store.lookup(None) is None
+
+
+def test_token_expires(store):
+    token = store.issue(7, expiration=1)
+    time.sleep(1.1)
+    assert store.lookup(token) is None
+
+
+def test_user_index_outlives_its_tokens(store):
+    store.issue(7, expiration=60)
+    store.issue(7, expiration=1)
+    assert store.client.ttl(store._user_key(7)) > 1
+
+
+def test_revoke(store):
+    token, other = store.issue(7, expiration=60), store.issue(7, expiration=60)
+    assert store.revoke(token)
+    assert not store.revoke(token)
+    assert store.lookup(token) is None
+    assert store.lookup(other) == 7
+
+
+def test_revoke_user(store):
+    tokens = [store.issue(7, expiration=60) for _ in range(3)]
+    other = store.issue(8, expiration=60)
+    store.revoke_user(7)
+    assert [store.lookup(token) for token in tokens] == [None] * 3
+    assert store.lookup(other) == 8
@@ -0,0 +1,150 @@
+"""
+Microbenchmark of the per-response cost of the `Reply` envelope.
+
+    $ python3 hack/benchmark-reply.py --rows 1 100 1000 --number 200
+    $ python3 hack/benchmark-reply.py --wire --rows 1000 10000 100000 --number 3
+
+Compares Flask's `jsonify` (the previous encoder) with `Reply` using the
+stdlib encoder and, when installed, orjson, for list payloads shaped like
+dumped issues. Times are microseconds per response. With `--wire` the bytes
+sent and the encode time of every representation `Reply` negotiates are
+compared instead, times in milliseconds.
+"""
+import os, sys, types, random, timeit, argparse
+
+here = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(here), "api"))
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+import logging
+from flask import jsonify, make_response
+import app as tix
+
+
+def payload(rows):
+    return [
+        dict(
+            id=i,
+            created_at=1615704659235 + i,
+            updated_at=None,
+            created_by="adam@example.com",
+            issue_name=f"ABC-{i:04d}",
+            issue_project="ABC",
+            issue_type="BUG",
+            issue_priority=3,
+            issue_story_points=5,
+            issue_summary="Allow users to edit tickets",
+            issue_description="Right now edits can only happen via API",
+            issue_status="OPEN",
+            issue_resolution="UNRESOLVED",
+            issue_affected_version=None,
+            issue_fixed_version=None,
+            issue_assigned_to="bill@example.com",
+        )
+        for i in range(rows)
+    ]
+
+
+def flask_jsonify(data):
+    return make_response(jsonify(data=data, status="success", response=200), 200)
+
+
+def reply(data):
+    return tix.Reply.success(data=data)
+
+
+def reply_stream(data):
+    response = tix.Reply.stream(iter(data))
+    return b"".join(response.response)
+
+
+# (name, Accept, Accept-Encoding), skipped when the encoder is not installed
+REPRESENTATIONS = [
+    ("json", "application/json", None),
+    ("json+gzip", "application/json", "gzip"),
+    ("json+br", "application/json", "br"),
+    ("msgpack", "application/msgpack", None),
+    ("msgpack+gzip", "application/msgpack", "gzip"),
+    ("msgpack+br", "application/msgpack", "br"),
+]
+
+
+def varied(data):
+    """
+    Generated text for the free-form fields, identical rows would compress
+    far better than real ones.
+    """
+    import lorem
+
+    random.seed(0)
+    for item in data:
+        item.update(issue_summary=lorem.sentence(), issue_description=lorem.paragraph())
+    return data
+
+
+def wire(app, args):
+    cases = [
+        (name, accept, encoding)
+        for name, accept, encoding in REPRESENTATIONS
+        if (tix.msgpack or "msgpack" not in name) and (tix.brotli or encoding != "br")
+    ]
+    print(f"{'rows':>6} {'representation':>14} {'bytes':>12} {'ratio':>6} {'ms':>10}")
+    for rows in args.rows:
+        data = varied(payload(rows))
+        baseline = None
+        for name, accept, encoding in cases:
+            headers = {"Accept": accept, "Accept-Encoding": encoding or "identity"}
+            with app.test_request_context("/api/issues", headers=headers):
+                response = reply(data)
+                assert response.headers.get("Content-Encoding") == encoding, name
+                size = len(response.get_data())
+                seconds = min(
+                    timeit.repeat(lambda: reply(data), number=args.number, repeat=3)
+                )
+            baseline = baseline or size
+            print(
+                f"{rows:>6} {name:>14} {size:>12} {size / baseline:>6.2f} "
+                f"{seconds / args.number * 1e3:>10.2f}"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--rows", type=int, nargs="+", default=[1, 100, 1000])
+    parser.add_argument("--number", type=int, default=200)
+    parser.add_argument(
+        "--wire", action="store_true", help="compare bytes sent per representation"
+    )
+    args = parser.parse_args()
+
+    app = tix.create_app(types.SimpleNamespace(configuration="production"))
+    logging.getLogger().setLevel(logging.WARNING)
+    if args.wire:
+        return wire(app, args)
+    orjson = tix.orjson
+    cases = [("jsonify", flask_jsonify, None), ("reply[json]", reply, False)]
+    if orjson is not None:
+        cases += [
+            ("reply[orjson]", reply, True),
+            ("stream[orjson]", reply_stream, True),
+        ]
+    else:
+        cases += [("stream[json]", reply_stream, False)]
+
+    print(f"{'rows':>6} " + " ".join(f"{name:>16}" for name, _, _ in cases))
+    for rows in args.rows:
+        data = payload(rows)
+        results = []
+        with app.test_request_context("/api/issues"):
+            for name, func, use_orjson in cases:
+                tix.orjson = orjson if use_orjson else None
+                seconds = min(
+                    timeit.repeat(lambda: func(data), number=args.number, repeat=3)
+                )
+                results.append(seconds / args.number * 1e6)
+        tix.orjson = orjson
+        print(f"{rows:>6} " + " ".join(f"{us:>14.1f}us" for us in results))
+
+
+if __name__ == "__main__":
+    main()
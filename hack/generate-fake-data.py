@@ -1,4 +1,15 @@
-import os, sys, json, copy, random
+"""
+Generate fake users, issues & activity for development and load testing.
+
+    $ python3 hack/generate-fake-data.py --issues 1000000 --activity 5000000
+    $ python3 hack/generate-fake-data.py --issues 100000 --database -c development
+
+Records are streamed to disk (or to the database) as they are generated, so
+memory use stays flat regardless of the dataset size. Activity `issue_id`s
+refer to the position of the issue in the generated set, load the issues
+into an empty table first.
+"""
+import os, sys, json, types, random, string, argparse, itertools
 
 try:
     import lorem
@@ -7,112 +18,200 @@ except:
     sys.exit(1)
 
 here = os.path.dirname(os.path.abspath(__file__))
-data = os.path.join(os.path.dirname(here), "api", "data")
-print(f"Data folder: {data}")
-
-NUM_ISSUES = 100
-NUM_ACTIVITY = 500
-ISSUES_FILE = os.path.join(data, "issues.json")
-ACTIVITY_FILE = os.path.join(data, "activity.json")
-
-issue_template = {
-    # "activity": [],
-    # "created_at": 1615704659235,
-    # "id": 4,
-    # "issue_name": "DWB-0004",
-    # "updated_at": None,
-    "created_by": "user@example.com",
-    "issue_affected_version": None,
-    "issue_assigned_to": None,
-    "issue_description": "Right now edits can only happen via API, we should design an interface for this",
-    "issue_fixed_version": None,
-    "issue_priority": 1,
-    "issue_project": "DWB",
-    "issue_resolution": "unresolved",
-    "issue_status": "open",
-    "issue_story_points": 2,
-    "issue_summary": "Allow users to edit tickets",
-    "issue_type": "feature",
-}
-issue_project = lambda: "ABC"
-issue_affected_version = lambda: None
-issue_fixed_version = lambda: None
-issue_priority = lambda: random.choice([1, 2, 3, 4, 5])
-issue_story_points = lambda: random.choice([1, 2, 3, 5, 6, 7, 8])
-created_by = (
-    lambda: random.choice(["adam", "bill", "cary", "diane", "evan", "fred", "greg"])
-    + "@example.com"
-)
-issue_assigned_to = lambda: None if random.random() > 0.75 else created_by()
-issue_resolution = (
-    lambda: "unresolved"
-    if random.random() > 0.75
-    else random.choice(
-        [
-            "invalid",
-            "wont_fix",
-            "overcome_by_events",
-            "unable_to_replicate",
-            "duplicate",
-            "complete",
-        ]
+api = os.path.join(os.path.dirname(here), "api")
+data = os.path.join(api, "data")
+
+DEFAULT_PROJECTS = ["ABC"]
+DEFAULT_USERS = ["adam", "bill", "cary", "diane", "evan", "fred", "greg"]
+# plaintext "password", hashed once rather than per generated user
+DEFAULT_PASSWORD = "password"
+
+issue_priority = [1, 2, 3, 4, 5]
+issue_story_points = [1, 2, 3, 5, 6, 7, 8]
+issue_resolution = [
+    "invalid",
+    "wont_fix",
+    "overcome_by_events",
+    "unable_to_replicate",
+    "duplicate",
+    "complete",
+]
+issue_type = ["bug", "task", "feature", "requirement", "support", "epic"]
+issue_status = [
+    "open",
+    "assigned",
+    "in_progress",
+    "on_hold",
+    "under_review",
+    "done",
+    "released",
+]
+
+
+class Skewed(object):
+    """
+    Zipf-like sampler over `population`, the item at rank k is drawn with
+    weight 1 / k**skew. A skew of 0 is uniform.
+    """
+
+    def __init__(self, rng, population, skew):
+        self.rng = rng
+        self.population = population
+        weights = (1 / (rank ** skew) for rank in range(1, len(population) + 1))
+        self.cum_weights = list(itertools.accumulate(weights))
+
+    def __call__(self):
+        return self.rng.choices(self.population, cum_weights=self.cum_weights)[0]
+
+
+def project_names(rng, count):
+    names = list(DEFAULT_PROJECTS[:count])
+    while len(names) < count:
+        name = "".join(rng.choices(string.ascii_uppercase, k=3))
+        if name not in names:
+            names.append(name)
+    return names
+
+
+def user_names(count):
+    if not count:
+        return [f"{name}@example.com" for name in DEFAULT_USERS]
+    return [f"user{i:07d}@example.com" for i in range(1, count + 1)]
+
+
+def generate_users(rng, users, password):
+    for username in users:
+        yield dict(username=username, password=password, user_type="USER")
+
+
+def generate_issues(rng, count, projects, users, skew):
+    project = Skewed(rng, projects, skew)
+    user = Skewed(rng, users, skew)
+    for _ in range(count):
+        yield dict(
+            created_by=user(),
+            issue_affected_version=None,
+            issue_assigned_to=None if rng.random() > 0.75 else user(),
+            issue_description=lorem.paragraph(),
+            issue_fixed_version=None,
+            issue_priority=rng.choice(issue_priority),
+            issue_project=project(),
+            issue_resolution=(
+                "unresolved" if rng.random() > 0.75 else rng.choice(issue_resolution)
+            ).upper(),
+            issue_status=rng.choice(issue_status).upper(),
+            issue_story_points=rng.choice(issue_story_points),
+            issue_summary=lorem.sentence(),
+            issue_type=rng.choice(issue_type).upper(),
+        )
+
+
+def generate_activity(rng, count, num_issues, users, skew):
+    # a few hot issues collect most of the comments
+    issue_id = Skewed(rng, range(1, num_issues + 1), skew)
+    user = Skewed(rng, users, skew)
+    for _ in range(count):
+        yield dict(
+            issue_id=issue_id(),
+            created_by=user(),
+            activity_type="COMMENT",
+            activity_text=lorem.sentence(),
+        )
+
+
+def write_records(path, records, fmt):
+    count = 0
+    with open(path, "w") as file:
+        if fmt == "json":
+            file.write("[")
+        for record in records:
+            if fmt == "json":
+                file.write(",\n" if count else "\n")
+            file.write(json.dumps(record, separators=(",", ":")))
+            if fmt == "ndjson":
+                file.write("\n")
+            count += 1
+        if fmt == "json":
+            file.write("\n]\n")
+    print(f"Wrote {count} items to {path}")
+
+
+def database_writer(configuration, batch_size):
+    """
+    Insert through the application's own bulk loader, such that generated
+    rows go through the same validation & issue name allocation.
+    """
+    sys.path.insert(0, api)
+    from app import create_app, bulk_load, db
+
+    app = create_app(types.SimpleNamespace(configuration=configuration))
+    ctx = app.app_context()
+    ctx.push()
+    db.create_all()
+
+    def write(table, records):
+        bulk_load(table, records, batch_size=batch_size)
+
+    return write
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--users", type=int, default=0, help="default: none")
+    parser.add_argument("--issues", type=int, default=100)
+    parser.add_argument("--activity", type=int, default=500)
+    parser.add_argument("--projects", type=int, default=1)
+    parser.add_argument(
+        "--skew",
+        type=float,
+        default=0.0,
+        help="Zipf exponent for projects, users & commented issues, 0 is uniform",
     )
-)
-issue_type = lambda: random.choice(
-    ["bug", "task", "feature", "requirement", "support", "epic"]
-)
-issue_status = lambda: random.choice(
-    ["open", "assigned", "in_progress", "on_hold", "under_review", "done", "released"]
-)
-
-issue_summary = lambda: lorem.sentence()
-issue_description = lambda: lorem.paragraph()
-
-issues = []
-for _ in range(NUM_ISSUES):
-    i = dict(
-        created_by=created_by(),
-        issue_affected_version=issue_affected_version(),
-        issue_assigned_to=issue_assigned_to(),
-        issue_description=issue_description(),
-        issue_fixed_version=issue_fixed_version(),
-        issue_priority=issue_priority(),
-        issue_project=issue_project(),
-        issue_resolution=issue_resolution().upper(),
-        issue_status=issue_status().upper(),
-        issue_story_points=issue_story_points(),
-        issue_summary=issue_summary(),
-        issue_type=issue_type().upper(),
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--format", choices=["json", "ndjson"], default="json")
+    parser.add_argument("--output", default=data, help=f"default: {data}")
+    parser.add_argument(
+        "--database",
+        action="store_true",
+        help="Write directly to the application database instead of files",
     )
-    issues.append(i)
-
-print(f"Writing {NUM_ISSUES} items to {ISSUES_FILE}")
-with open(ISSUES_FILE, "w") as file:
-    json.dump(issues, file, indent=4)
-
-# -----------------------------------------------------------------------------
-activity_template = {
-    "issue_id": 1,
-    "created_by": "user@example.com",
-    "activity_type": "comment",
-    "activity_text": "hello world! I am leaving this comment here for someone to read later on.",
-}
-
-issue_id = lambda: random.randint(1, NUM_ISSUES)
-# created_by same as before
-activity_type = lambda: "comment".upper()
-activity_text = lambda: lorem.sentence()
-
-activity = []
-for _ in range(NUM_ACTIVITY):
-    a = dict(
-        issue_id=issue_id(),
-        created_by=created_by(),
-        activity_type=activity_type().upper(),
-        activity_text=activity_text(),
+    parser.add_argument(
+        "-c",
+        "--configuration",
+        default=os.getenv("FLASK_ENV", "development"),
+        help="Application configuration used with --database",
     )
-    activity.append(a)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    # lorem draws from the global generator
+    random.seed(args.seed)
+    projects = project_names(rng, args.projects)
+    users = user_names(args.users)
+
+    if args.database:
+        write = database_writer(args.configuration, args.batch_size)
+    else:
+        print(f"Data folder: {args.output}")
+        os.makedirs(args.output, exist_ok=True)
+
+        def write(table, records):
+            path = os.path.join(args.output, f"{table}.{args.format}")
+            write_records(path, records, args.format)
+
+    if args.users:
+        from passlib.apps import custom_app_context as password_context
+
+        password = password_context.hash(DEFAULT_PASSWORD)
+        write("users", generate_users(rng, users, password))
+    write("issues", generate_issues(rng, args.issues, projects, users, args.skew))
+    if args.issues:
+        write(
+            "activity",
+            generate_activity(rng, args.activity, args.issues, users, args.skew),
+        )
+
 
-print(f"Writing {NUM_ACTIVITY} items to {ACTIVITY_FILE}")
-with open(ACTIVITY_FILE, "w") as file:
-    json.dump(activity, file, indent=4)
+if __name__ == "__main__":
+    main()
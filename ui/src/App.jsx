@@ -32,6 +32,20 @@ window.jQuery = window.$ = $;
 
 console.log(`ENV: ${ENV}`);
 
+// the columns shown by the issue table & dashboard, see `?fields=`
+const ISSUE_TABLE_FIELDS = [
+  'id',
+  'created_at',
+  'issue_name',
+  'issue_type',
+  'issue_priority',
+  'issue_story_points',
+  'issue_summary',
+  'issue_status',
+  'issue_resolution',
+  'issue_assigned_to',
+].join(',');
+
 export default function App() {
   // auth
   const [user, setUser] = useState(getLocalStorage('user.username'));
@@ -47,11 +61,27 @@ export default function App() {
    */
   useEffect(() => {
     let mounted = true;
-    request({ route: '/issues', method: 'GET' }).then((issues) => {
-      if (mounted) {
-        setIssues(issues);
-      }
-    });
+    // pages hold at most 1000 issues, follow the cursor through all of them
+    // and show each as it arrives
+    const loadIssues = async () => {
+      const params = { size: 1000, fields: ISSUE_TABLE_FIELDS };
+      const data = [];
+      let cursor = null;
+      do {
+        const page = await request({
+          route: '/issues',
+          method: 'GET',
+          params: cursor ? { ...params, cursor } : params,
+        });
+        if (!mounted) {
+          return;
+        }
+        data.push(...(page.data || []));
+        setIssues({ ...page, data: [...data] });
+        cursor = page.links?.cursor;
+      } while (cursor);
+    };
+    loadIssues();
     return () => (mounted = false);
   }, []);
 